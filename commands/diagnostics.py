@@ -0,0 +1,75 @@
+import asyncio
+import io
+import threading
+import discord
+from discord.ext import commands
+from config.config import PROFILE_MAX_SECONDS
+from utils.loop_watchdog import watchdog, sample_profile
+
+class Diagnostics(commands.Cog):
+    """Event-loop stall and profiling commands"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.profiling = False
+
+    @commands.command(name="stalls", aliases=["lag"])
+    @commands.has_permissions(
+        view_channel=True,
+        send_messages=True,
+        attach_files=True,
+        administrator=True
+    )
+    async def stalls(self, ctx):
+        """Dump the rolling report of event-loop stalls"""
+        if not watchdog.running:
+            await ctx.send("❌ The loop watchdog is not enabled. Set `LOOP_WATCHDOG_ENABLED` in the config.")
+            return
+
+        report = watchdog.report()
+        if len(report) <= 1900:
+            await ctx.send(f"```\n{report}\n```")
+        else:
+            await ctx.send(file=discord.File(io.BytesIO(report.encode()), filename="stalls.txt"))
+
+    @commands.command(name="profile")
+    @commands.has_permissions(
+        view_channel=True,
+        send_messages=True,
+        attach_files=True,
+        administrator=True
+    )
+    async def profile(self, ctx, seconds: float = 10):
+        """Sample the event loop for a few seconds and upload collapsed stacks for a flame graph"""
+        if not 0 < seconds <= PROFILE_MAX_SECONDS:
+            await ctx.send(f"❌ Profile length must be between 0 and {PROFILE_MAX_SECONDS} seconds.")
+            return
+        if self.profiling:
+            await ctx.send("❌ A profiling session is already running.")
+            return
+
+        self.profiling = True
+        try:
+            await ctx.send(f"⏱️ Profiling the event loop for {seconds:g}s...")
+            # Commands run on the event-loop thread, so this is the thread to sample
+            loop_thread_id = threading.get_ident()
+            folded = await asyncio.to_thread(sample_profile, loop_thread_id, seconds)
+        finally:
+            self.profiling = False
+
+        await ctx.send(
+            "✅ Profile complete. Render it with `flamegraph.pl` or speedscope.",
+            file=discord.File(io.BytesIO(folded.encode()), filename="profile.folded")
+        )
+
+    @stalls.error
+    @profile.error
+    async def diagnostics_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
+            await ctx.send(f"❌ Missing required permissions: {', '.join(missing_perms)}")
+        elif isinstance(error, commands.BadArgument):
+            await ctx.send("❌ Please provide the profile length in seconds.")
+
+async def setup(bot):
+    await bot.add_cog(Diagnostics(bot))
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import os
+import time
+import discord
+from discord.ext import commands
+from config.config import POLL_UPDATE_INTERVAL_SECONDS, POLL_STORE_PATH
+
+POLL_OPTIONS = {"👍": "Yes", "👎": "No"}
+
+class Polls(commands.Cog):
+    """Poll commands with live vote tallies"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        # Open polls by message ID: guild, channel, question, author, {user_id: emoji} votes
+        # and {user_id: [emoji, ...]} poll reactions each user currently has, oldest first
+        self.polls = {}
+        # Pending debounced embed updates by message ID
+        self.update_tasks = {}
+        # Monotonic time of the last embed edit by message ID
+        self.last_edit = {}
+        # Serializes store writes so an older snapshot never overwrites a newer one
+        self.save_lock = asyncio.Lock()
+        self.reconcile_task = None
+
+    async def cog_load(self):
+        self.load_polls()
+        if self.polls:
+            self.reconcile_task = asyncio.create_task(self.reconcile_polls())
+
+    async def cog_unload(self):
+        if self.reconcile_task:
+            self.reconcile_task.cancel()
+        for task in self.update_tasks.values():
+            task.cancel()
+        await self.save_polls()
+
+    def load_polls(self):
+        """Restore open polls saved by a previous run"""
+        if not os.path.exists(POLL_STORE_PATH):
+            return
+        try:
+            with open(POLL_STORE_PATH, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load polls: {e}")
+            return
+
+        # JSON object keys are strings, so convert the IDs back to ints
+        for message_id, poll in stored.items():
+            poll["votes"] = {int(user_id): emoji for user_id, emoji in poll["votes"].items()}
+            poll["reactions"] = {int(user_id): emojis for user_id, emojis in poll["reactions"].items()}
+            self.polls[int(message_id)] = poll
+        print(f"✅ Restored {len(self.polls)} open poll(s)")
+
+    async def save_polls(self):
+        """Persist open polls so a restart doesn't lose counts"""
+        async with self.save_lock:
+            # Snapshot on the loop, where the polls are mutated, then write off it
+            data = json.dumps(self.polls)
+            try:
+                await asyncio.to_thread(self._write_store, data)
+            except OSError as e:
+                print(f"❌ Could not save polls: {e}")
+
+    @staticmethod
+    def _write_store(data: str):
+        tmp_path = f"{POLL_STORE_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, POLL_STORE_PATH)
+
+    async def reconcile_polls(self):
+        """Catch up on reactions added or removed while the bot was offline.
+
+        Fetches each restored poll's reactions once. Votes that still have
+        their reaction are kept; otherwise a user's remaining reaction counts.
+        """
+        for message_id, poll in list(self.polls.items()):
+            message = self.bot.get_partial_messageable(poll["channel_id"]).get_partial_message(message_id)
+            try:
+                fetched = await message.fetch()
+                reacted = {emoji: set() for emoji in POLL_OPTIONS}
+                for reaction in fetched.reactions:
+                    emoji = str(reaction.emoji)
+                    if emoji in reacted:
+                        reacted[emoji] = {user.id async for user in reaction.users() if user.id != self.bot.user.id}
+            except discord.NotFound:
+                # The poll message was deleted while the bot was offline
+                self.polls.pop(message_id, None)
+                continue
+            except discord.HTTPException as e:
+                print(f"❌ Could not reconcile poll {message_id}: {e}")
+                continue
+
+            reactions = {}
+            for emoji, user_ids in reacted.items():
+                for user_id in user_ids:
+                    reactions.setdefault(user_id, []).append(emoji)
+            votes = {}
+            for user_id, emojis in reactions.items():
+                vote = poll["votes"].get(user_id)
+                votes[user_id] = vote if vote in emojis else emojis[-1]
+            poll["reactions"] = reactions
+            if votes != poll["votes"]:
+                poll["votes"] = votes
+                self.schedule_update(message_id)
+        await self.save_polls()
+
+    def build_embed(self, poll: dict, closed: bool = False) -> discord.Embed:
+        """Build the poll embed with the current tally"""
+        counts = {emoji: 0 for emoji in POLL_OPTIONS}
+        for emoji in poll["votes"].values():
+            counts[emoji] += 1
+
+        embed = discord.Embed(
+            title="Poll Closed" if closed else "New Poll",
+            description=poll["question"],
+            color=discord.Color.dark_grey() if closed else discord.Color.blue()
+        )
+        for emoji, label in POLL_OPTIONS.items():
+            embed.add_field(name=f"{emoji} {label}", value=counts[emoji], inline=True)
+        embed.set_footer(text=f"Final tally: {len(poll['votes'])} vote(s)" if closed else f"{len(poll['votes'])} vote(s)")
+        return embed
+
+    def schedule_update(self, message_id: int):
+        """Edit the poll embed at most once every POLL_UPDATE_INTERVAL_SECONDS"""
+        if message_id in self.update_tasks:
+            # An update is already pending and will pick up this vote
+            return
+        self.update_tasks[message_id] = asyncio.create_task(self.flush_update(message_id))
+
+    async def flush_update(self, message_id: int):
+        """Wait out the update interval, then persist and edit the poll embed"""
+        try:
+            wait = self.last_edit.get(message_id, 0) + POLL_UPDATE_INTERVAL_SECONDS - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        finally:
+            self.update_tasks.pop(message_id, None)
+
+        poll = self.polls.get(message_id)
+        if not poll:
+            return
+
+        self.last_edit[message_id] = time.monotonic()
+        await self.save_polls()
+        message = self.bot.get_partial_messageable(poll["channel_id"]).get_partial_message(message_id)
+        try:
+            await message.edit(embed=self.build_embed(poll))
+        except discord.NotFound:
+            # The poll message was deleted, stop tracking it
+            self.polls.pop(message_id, None)
+            self.last_edit.pop(message_id, None)
+            await self.save_polls()
+        except discord.HTTPException as e:
+            print(f"❌ Could not update poll {message_id}: {e}")
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        poll = self.polls.get(payload.message_id)
+        emoji = str(payload.emoji)
+        if not poll or emoji not in POLL_OPTIONS or payload.user_id == self.bot.user.id:
+            return
+
+        reactions = poll["reactions"].setdefault(payload.user_id, [])
+        if emoji not in reactions:
+            reactions.append(emoji)
+
+        # One vote per user: the latest reaction replaces any earlier vote
+        if poll["votes"].get(payload.user_id) == emoji:
+            return
+        poll["votes"][payload.user_id] = emoji
+        self.schedule_update(payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        poll = self.polls.get(payload.message_id)
+        emoji = str(payload.emoji)
+        if not poll or emoji not in POLL_OPTIONS:
+            return
+
+        reactions = poll["reactions"].get(payload.user_id, [])
+        if emoji in reactions:
+            reactions.remove(emoji)
+        if not reactions:
+            poll["reactions"].pop(payload.user_id, None)
+
+        # If the counted reaction is removed, the user's remaining one counts
+        if poll["votes"].get(payload.user_id) == emoji:
+            if reactions:
+                poll["votes"][payload.user_id] = reactions[-1]
+            else:
+                del poll["votes"][payload.user_id]
+            self.schedule_update(payload.message_id)
+
+    @commands.command(name="poll")
+    @commands.has_permissions(
+        view_channel=True,
+        send_messages=True,
+        embed_links=True,
+        add_reactions=True,
+        use_external_emojis=True
+    )
+    async def poll(self, ctx, *, question):
+        """Create a poll with thumbs up/down reactions"""
+        poll = {
+            # Polls also work in DMs, where there is no guild
+            "guild_id": ctx.guild.id if ctx.guild else None,
+            "channel_id": ctx.channel.id,
+            "author_id": ctx.author.id,
+            "question": question,
+            "votes": {},
+            "reactions": {}
+        }
+        poll_message = await ctx.send(embed=self.build_embed(poll))
+        self.polls[poll_message.id] = poll
+        await self.save_polls()
+        for emoji in POLL_OPTIONS:
+            await poll_message.add_reaction(emoji)
+
+    def poll_in_context(self, poll: dict, ctx) -> bool:
+        """Whether a poll belongs to the server, or the DM, the command was used in"""
+        if ctx.guild is None:
+            return poll["guild_id"] is None and poll["channel_id"] == ctx.channel.id
+        channel = self.bot.get_channel(poll["channel_id"])
+        return poll["guild_id"] == ctx.guild.id and channel is not None and channel.guild == ctx.guild
+
+    @commands.command(name="closepoll", aliases=["endpoll"])
+    @commands.has_permissions(
+        view_channel=True,
+        send_messages=True,
+        embed_links=True
+    )
+    async def close_poll(self, ctx, message_id: int):
+        """Close a poll and post its final tally"""
+        poll = self.polls.get(message_id)
+        # Polls from other servers are reported as missing rather than closed
+        if not poll or not self.poll_in_context(poll, ctx):
+            await ctx.send("❌ Poll not found or already closed.")
+            return
+
+        # Only the poll author or a moderator can close it
+        is_moderator = ctx.guild is not None and ctx.author.guild_permissions.manage_messages
+        if ctx.author.id != poll["author_id"] and not is_moderator:
+            await ctx.send("❌ Only the poll author or a moderator can close this poll.")
+            return
+
+        del self.polls[message_id]
+        self.last_edit.pop(message_id, None)
+        task = self.update_tasks.pop(message_id, None)
+        if task:
+            task.cancel()
+        await self.save_polls()
+
+        embed = self.build_embed(poll, closed=True)
+        try:
+            message = self.bot.get_partial_messageable(poll["channel_id"]).get_partial_message(message_id)
+            await message.edit(embed=embed)
+        except discord.HTTPException:
+            pass
+        await ctx.send(embed=embed)
+
+    @poll.error
+    @close_poll.error
+    async def poll_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
+            await ctx.send(f"❌ Missing required permissions: {', '.join(missing_perms)}")
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send("❌ Please provide all required arguments. Use `!help` for command usage.")
+        elif isinstance(error, commands.BadArgument):
+            await ctx.send("❌ Please provide a valid poll message ID.")
+
+async def setup(bot):
+    await bot.add_cog(Polls(bot))
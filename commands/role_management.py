@@ -1,5 +1,10 @@
 import discord
 from discord.ext import commands
+from utils.cooldowns import expensive_command
+from utils.listing_cache import get_listing, store_listing, invalidate_listing
+from utils.pagination import ListingPaginator, paginate
+
+ROLES_PER_PAGE = 20
 
 class RoleManagement(commands.Cog):
     """Role management commands"""
@@ -7,6 +12,18 @@ class RoleManagement(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
     
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role):
+        invalidate_listing(role.guild.id, "roles")
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        invalidate_listing(role.guild.id, "roles")
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before, after):
+        invalidate_listing(after.guild.id, "roles")
+    
     @commands.command(name="assignrole", aliases=["ar", "giverole"])
     @commands.has_permissions(
         view_channel=True,
@@ -90,6 +107,7 @@ class RoleManagement(commands.Cog):
         embed_links=True,
         read_message_history=True
     )
+    @expensive_command()
     async def list_roles(self, ctx, member: discord.Member = None):
         """List roles for a member or all server roles"""
         if member:
@@ -99,26 +117,26 @@ class RoleManagement(commands.Cog):
                 await ctx.send(f"{member.mention} has no roles.")
                 return
             
-            embed = discord.Embed(
-                title=f"Roles for {member.display_name}",
-                description="\n".join(roles) if roles else "No roles",
-                color=discord.Color.blue()
+            paginator = ListingPaginator(
+                ctx.author.id,
+                f"Roles for {member.display_name}",
+                paginate(roles, ROLES_PER_PAGE),
+                f"{len(roles)} roles"
             )
-            embed.add_field(name="Total Roles", value=len(roles), inline=True)
-            await ctx.send(embed=embed)
+            await paginator.send(ctx)
         else:
-            # List all server roles
-            roles = [role.mention for role in ctx.guild.roles if role.name != "@everyone"]
-            roles.reverse()  # Show highest roles first
+            # List all server roles, reusing recently rendered pages
+            cached = get_listing(ctx.guild.id, "roles")
+            if cached:
+                pages, total = cached
+            else:
+                roles = [role.mention for role in ctx.guild.roles if role.name != "@everyone"]
+                roles.reverse()  # Show highest roles first
+                pages, total = paginate(roles, ROLES_PER_PAGE) or ["No roles"], len(roles)
+                store_listing(ctx.guild.id, "roles", pages, total)
             
-            embed = discord.Embed(
-                title=f"Server Roles ({len(roles)})",
-                description="\n".join(roles[:20]) if len(roles) > 0 else "No roles",
-                color=discord.Color.blue()
-            )
-            if len(roles) > 20:
-                embed.set_footer(text=f"Showing first 20 of {len(roles)} roles")
-            await ctx.send(embed=embed)
+            paginator = ListingPaginator(ctx.author.id, f"Server Roles ({total})", pages, f"{total} roles")
+            await paginator.send(ctx)
     
     @commands.command(name="createrole", aliases=["cr", "newrole"])
     @commands.has_permissions(
@@ -194,6 +212,8 @@ class RoleManagement(commands.Cog):
             await ctx.send(f"❌ Missing required permissions: {', '.join(missing_perms)}")
         elif isinstance(error, commands.MissingRequiredArgument):
             await ctx.send("❌ Please provide all required arguments. Use `!help` for command usage.")
+        elif isinstance(error, commands.CommandOnCooldown):
+            await ctx.send(f"⏳ This command is on cooldown. Try again in {error.retry_after:.0f}s.", delete_after=5)
 
 async def setup(bot):
     await bot.add_cog(RoleManagement(bot))
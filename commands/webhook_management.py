@@ -1,6 +1,11 @@
 import discord
 from discord.ext import commands
 from discord import Webhook
+from utils.cooldowns import expensive_command
+from utils.listing_cache import get_listing, store_listing, invalidate_listing
+from utils.pagination import ListingPaginator, paginate
+
+WEBHOOKS_PER_PAGE = 10
 
 class WebhookManagement(commands.Cog):
     """Webhook management commands"""
@@ -8,6 +13,10 @@ class WebhookManagement(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
     
+    @commands.Cog.listener()
+    async def on_webhooks_update(self, channel):
+        invalidate_listing(channel.guild.id, "webhooks")
+    
     @commands.command(name="createwebhook", aliases=["cw", "webhook"])
     @commands.has_permissions(
         view_channel=True,
@@ -45,41 +54,41 @@ class WebhookManagement(commands.Cog):
         read_message_history=True,
         manage_webhooks=True
     )
+    @expensive_command()
     async def list_webhooks(self, ctx, channel: discord.TextChannel = None):
         """List all webhooks in a channel or server"""
         target_channel = channel
+        scope = target_channel.id if target_channel else None
         
-        if target_channel:
-            webhooks = await target_channel.webhooks()
+        # Reuse recently rendered pages instead of fetching webhooks again
+        cached = get_listing(ctx.guild.id, "webhooks", scope)
+        if cached:
+            pages, total = cached
         else:
-            # Get all webhooks in the server
-            webhooks = []
-            for ch in ctx.guild.text_channels:
+            if target_channel:
+                webhooks = await target_channel.webhooks()
+            else:
+                # Get all webhooks in the server
                 try:
-                    ch_webhooks = await ch.webhooks()
-                    webhooks.extend(ch_webhooks)
-                except:
-                    pass
+                    webhooks = await ctx.guild.webhooks()
+                except discord.Forbidden:
+                    await ctx.send("❌ I don't have permission to view this server's webhooks.")
+                    return
+            
+            webhook_list = []
+            for webhook in webhooks:
+                channel_mention = f"<#{webhook.channel_id}>" if webhook.channel_id else "Unknown"
+                webhook_list.append(f"**{webhook.name}** - {channel_mention}")
+            
+            pages, total = paginate(webhook_list, WEBHOOKS_PER_PAGE), len(webhooks)
+            store_listing(ctx.guild.id, "webhooks", pages, total, scope)
         
-        if not webhooks:
+        if not total:
             await ctx.send("❌ No webhooks found.")
             return
         
-        embed = discord.Embed(
-            title=f"Webhooks ({len(webhooks)})",
-            color=discord.Color.blue()
-        )
-        
-        webhook_list = []
-        for webhook in webhooks[:10]:  # Limit to 10
-            channel_mention = f"<#{webhook.channel_id}>" if webhook.channel_id else "Unknown"
-            webhook_list.append(f"**{webhook.name}** - {channel_mention}")
-        
-        embed.description = "\n".join(webhook_list) if webhook_list else "No webhooks"
-        if len(webhooks) > 10:
-            embed.set_footer(text=f"Showing first 10 of {len(webhooks)} webhooks")
-        
-        await ctx.send(embed=embed)
+        paginator = ListingPaginator(ctx.author.id, f"Webhooks ({total})", pages, f"{total} webhooks")
+        await paginator.send(ctx)
     
     @commands.command(name="deletewebhook", aliases=["dw", "removewebhook"])
     @commands.has_permissions(
@@ -207,6 +216,8 @@ class WebhookManagement(commands.Cog):
             await ctx.send(f"❌ Missing required permissions: {', '.join(missing_perms)}")
         elif isinstance(error, commands.MissingRequiredArgument):
             await ctx.send("❌ Please provide all required arguments. Use `!help` for command usage.")
+        elif isinstance(error, commands.CommandOnCooldown):
+            await ctx.send(f"⏳ This command is on cooldown. Try again in {error.retry_after:.0f}s.", delete_after=5)
 
 async def setup(bot):
     await bot.add_cog(WebhookManagement(bot))
@@ -14,4 +14,43 @@ WELCOME_CHANNEL_NAME = "general"  # Channel name for welcome messages
 MAX_JOINS_PER_MINUTE = 5  # Max joins per minute before triggering anti-raid
 MAX_MESSAGES_PER_SECOND = 5  # Max messages per second before spam detection
 ACCOUNT_AGE_THRESHOLD_HOURS = 24  # Accounts newer than this are considered suspicious
+CLEANUP_INTERVAL_MINUTES = 5  # How often old anti-bot tracking data is cleared
 
+
+# Cohort-based raid scoring settings
+RAID_COHORT_WINDOW_SECONDS = 5  # Joins within this window are scored together
+RAID_COHORT_QUIET_SECONDS = 1  # Close the cohort early once no join has arrived for this long
+RAID_COHORT_MIN_SIZE = 4  # Cohorts smaller than this are never treated as a raid
+RAID_COHORT_MAX_SIZE = 1000  # Score the cohort early once it reaches this size
+RAID_COHORT_SCORE_THRESHOLD = 0.6  # Cohort score (0-1) at or above which the cohort is a raid
+
+# Poll settings
+POLL_UPDATE_INTERVAL_SECONDS = 2  # Minimum time between poll embed edits
+POLL_STORE_PATH = "polls.json"  # File where open polls are persisted across restarts
+
+# Event dispatcher settings
+GUILD_QUEUE_MAX_SIZE = 100  # Max pending moderation jobs per guild
+GUILD_QUEUE_OVERFLOW = "drop_cosmetic"  # "coalesce" (merge repeated keyed jobs), "drop_cosmetic" or "shed" when full
+EVENT_DISPATCH_WORKERS = 4  # Number of guild queues served concurrently
+
+# Event-loop watchdog settings
+LOOP_WATCHDOG_ENABLED = False  # Opt-in: run a thread that reports event-loop stalls
+LOOP_WATCHDOG_INTERVAL_SECONDS = 0.1  # How often the loop heartbeat is checked
+LOOP_WATCHDOG_THRESHOLD_SECONDS = 0.5  # Loop lag above this is reported as a stall
+LOOP_WATCHDOG_REPORT_SIZE = 20  # Number of recent stalls kept in the report
+PROFILE_MAX_SECONDS = 60  # Longest allowed sampling-profile session
+PROFILE_SAMPLE_INTERVAL_SECONDS = 0.005  # Time between profiler stack samples
+
+# Expensive command settings
+EXPENSIVE_COMMAND_USER_RATE = 1  # Uses allowed per user...
+EXPENSIVE_COMMAND_USER_PER_SECONDS = 10  # ...within this many seconds
+EXPENSIVE_COMMAND_GUILD_RATE = 3  # Uses allowed per guild...
+EXPENSIVE_COMMAND_GUILD_PER_SECONDS = 30  # ...within this many seconds
+LISTING_CACHE_TTL_SECONDS = 60  # How long rendered listing pages are reused
+LISTING_PAGE_TIMEOUT_SECONDS = 120  # How long listing page buttons stay active
+
+# Spam escalation settings
+OFFENSE_HISTORY_MINUTES = 60  # Offenses older than this no longer count towards escalation
+OFFENSE_BURST_SECONDS = 5  # Spam detections this close together count as one offense
+FIRST_TIMEOUT_MINUTES = 10  # Timeout for a second offense
+SECOND_TIMEOUT_MINUTES = 60  # Timeout for a third offense, a fourth one is a kick
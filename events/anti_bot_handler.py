@@ -1,17 +1,32 @@
 import discord
+from functools import partial
 from utils.anti_bot import (
     check_raid_protection,
     check_spam_protection,
     handle_raid_detection,
-    handle_spam_detection
+    handle_spam_detection,
+    queue_spam_delete,
+    discard_spam_delete
 )
+from utils.raid_cohort import submit_join
+from utils.event_dispatcher import dispatcher
+from utils.escalation import record_offense
 
 async def anti_bot_join_handler(bot: discord.Client, member: discord.Member):
     """Handle member joins with anti-bot protection"""
-    is_raid = await check_raid_protection(member)
+    # Score the join together with the rest of its cohort first; a raid
+    # cohort is already handled as a whole when this returns True
+    verdict = await submit_join(bot, member)
+    if verdict:
+        return True
+
+    # A cohort scored as benign is a busy moment, not a raid, so only joins
+    # that weren't scored fall back to the joins-per-minute rule
+    is_raid = await check_raid_protection(member, check_join_rate=verdict is None)
     
     if is_raid:
-        await handle_raid_detection(bot, member)
+        if not dispatcher.submit(member.guild.id, partial(handle_raid_detection, bot, member), critical=True):
+            print(f"❌ Could not queue raid response for {member.name}")
         return True  # Indicates suspicious activity
     
     return False
@@ -21,7 +36,21 @@ async def anti_bot_message_handler(message: discord.Message):
     is_spam = await check_spam_protection(message)
     
     if is_spam:
-        await handle_spam_detection(message)
+        guild_id = message.guild.id if message.guild else None
+        # Deletes for the same author and channel share a key, so they can
+        # be coalesced into one bulk delete
+        key = queue_spam_delete(message)
+        if not dispatcher.submit(
+            guild_id,
+            partial(handle_spam_detection, message.channel.id, message.author.id),
+            key=key
+        ):
+            # The guild is backed up with deletes; the escalation penalty below
+            # is critical and still goes through
+            discard_spam_delete(message)
+            print(f"❌ Dropped spam delete for {message.author.name}: moderation queue full")
+        # Record at detection time so the penalty isn't queued behind the deletes
+        record_offense(message)
         return True  # Indicates spam detected
     
     return False
@@ -1,15 +1,18 @@
 from config.config import BANNED_WORDS
 import discord
 
-async def censor_handler(message: discord.Message, bot: discord.Client):
-    """Handle message censorship"""
+def contains_banned_words(message: discord.Message) -> bool:
+    """Check whether a message should be censored"""
     if message.author.bot:
-        return
+        return False
     
     content = message.content.lower()
-    
+    return any(word in content for word in BANNED_WORDS)
+
+async def censor_handler(message: discord.Message, bot: discord.Client):
+    """Handle message censorship"""
     # Check for banned words
-    if any(word in content for word in BANNED_WORDS):
+    if contains_banned_words(message):
         try:
             await message.delete()
             await message.channel.send(
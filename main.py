@@ -1,12 +1,17 @@
+import asyncio
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import logging
+from functools import partial
 from dotenv import load_dotenv
-from config.config import DISCORD_TOKEN
+from config.config import DISCORD_TOKEN, LOOP_WATCHDOG_ENABLED, CLEANUP_INTERVAL_MINUTES
 from events.onReadyHandler import on_ready_handler
 from events.on_members_join import welcome_handler
-from events.on_message_censor import censor_handler
+from events.on_message_censor import censor_handler, contains_banned_words
 from events.anti_bot_handler import anti_bot_join_handler, anti_bot_message_handler
+from utils.anti_bot import clear_old_data
+from utils.event_dispatcher import dispatcher
+from utils.loop_watchdog import watchdog
 
 load_dotenv()
 
@@ -26,11 +31,33 @@ class TestBot(commands.Bot):
         super().__init__(command_prefix='!', intents=intents)
 
     async def setup_hook(self):
+        # Start the per-guild moderation queues
+        dispatcher.start()
+
+        # Periodically clear old anti-bot tracking data
+        self.cleanup_loop.start()
+
+        # Opt-in event-loop stall detection
+        if LOOP_WATCHDOG_ENABLED:
+            watchdog.start(asyncio.get_running_loop())
+
         # Load command extensions
         await self.load_extension("commands.role_management")
         await self.load_extension("commands.webhook_management")
+        await self.load_extension("commands.polls")
+        await self.load_extension("commands.diagnostics")
         print("✅ Bot setup complete.")
-        print("✅ Loaded command extensions: role_management, webhook_management")
+        print("✅ Loaded command extensions: role_management, webhook_management, polls, diagnostics")
+
+    @tasks.loop(minutes=CLEANUP_INTERVAL_MINUTES)
+    async def cleanup_loop(self):
+        clear_old_data()
+
+    async def close(self):
+        self.cleanup_loop.cancel()
+        watchdog.stop()
+        await dispatcher.stop()
+        await super().close()
 
     async def on_ready(self):
         await on_ready_handler(self)
@@ -45,7 +72,10 @@ class TestBot(commands.Bot):
             return  # Don't process commands if spam was detected
         
         # Message censorship
-        await censor_handler(message=message, bot=self)
+        if contains_banned_words(message):
+            guild_id = message.guild.id if message.guild else None
+            if not dispatcher.submit(guild_id, partial(censor_handler, message=message, bot=self)):
+                print(f"❌ Dropped censor delete for {message.author.name}: moderation queue full")
         await self.process_commands(message)
 
     async def on_member_join(self, member: discord.Member):
@@ -53,7 +83,12 @@ class TestBot(commands.Bot):
         raid_detected = await anti_bot_join_handler(self, member)
         if not raid_detected:
             # Only send welcome if not a raid
-            await welcome_handler(member)
+            dispatcher.submit(
+                member.guild.id,
+                partial(welcome_handler, member),
+                cosmetic=True,
+                key=("welcome", member.id)
+            )
 
 bot = TestBot()
 
@@ -64,21 +99,6 @@ async def hello(ctx):
     """Say hello to the bot"""
     await ctx.send(f"Hello {ctx.author.mention}!")
 
-@bot.command()
-@commands.has_permissions(
-    view_channel=True,
-    send_messages=True,
-    embed_links=True,
-    add_reactions=True,
-    use_external_emojis=True
-)
-async def poll(ctx, *, question):
-    """Create a poll with thumbs up/down reactions"""
-    embed = discord.Embed(title="New Poll", description=question, color=discord.Color.blue())
-    poll_message = await ctx.send(embed=embed)
-    await poll_message.add_reaction("👍")
-    await poll_message.add_reaction("👎")
-
 @bot.command()
 @commands.has_permissions(view_channel=True, send_messages=True)
 async def ping(ctx):
@@ -100,10 +120,36 @@ async def info(ctx):
     embed.add_field(name="Bot User", value=bot.user.name, inline=True)
     await ctx.send(embed=embed)
 
+@bot.command()
+@commands.has_permissions(view_channel=True, send_messages=True, embed_links=True, manage_guild=True)
+async def stats(ctx):
+    """Show moderation queue statistics"""
+    guild_stats = dispatcher.stats(ctx.guild.id)[ctx.guild.id]
+    all_stats = dispatcher.stats()
+    embed = discord.Embed(title="Bot Statistics", color=discord.Color.blue())
+    embed.add_field(name="Queue Depth", value=guild_stats["depth"], inline=True)
+    embed.add_field(name="Oldest Job", value=f"{guild_stats['oldest_wait']:.2f}s", inline=True)
+    embed.add_field(name="Last Lag", value=f"{guild_stats['last_lag']:.2f}s", inline=True)
+    embed.add_field(name="Processed", value=guild_stats["processed"], inline=True)
+    embed.add_field(name="Dropped", value=guild_stats["dropped"], inline=True)
+    embed.add_field(name="Coalesced", value=guild_stats["coalesced"], inline=True)
+    embed.add_field(
+        name="All Guilds",
+        value=f"{sum(s['depth'] for s in all_stats.values())} job(s) queued across {len(all_stats)} guild(s)",
+        inline=False
+    )
+    if watchdog.running:
+        embed.add_field(
+            name="Event Loop",
+            value=f"{len(watchdog.stalls)} recent stall(s), worst lag {watchdog.max_lag:.2f}s. Use `!stalls` for details.",
+            inline=False
+        )
+    await ctx.send(embed=embed)
+
 @hello.error
-@poll.error
 @ping.error
 @info.error
+@stats.error
 async def basic_command_error(ctx, error):
     if isinstance(error, commands.MissingPermissions):
         missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
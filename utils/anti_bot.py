@@ -1,6 +1,7 @@
 import discord
 from datetime import datetime, timedelta
 from collections import defaultdict
+from utils.escalation import clear_old_offenses
 
 # Track member joins per guild
 member_joins = defaultdict(list)
@@ -8,6 +9,8 @@ member_joins = defaultdict(list)
 message_spam = defaultdict(list)
 # Track suspicious accounts
 suspicious_accounts = defaultdict(set)
+# Spam messages waiting to be deleted per (channel_id, author_id): {"channel", "message_ids"}
+pending_spam_deletes = {}
 
 # Import config values (with defaults if not available)
 try:
@@ -18,26 +21,34 @@ except ImportError:
     MAX_MESSAGES_PER_SECOND = 5
     ACCOUNT_AGE_THRESHOLD_HOURS = 24
 
-async def check_raid_protection(member: discord.Member) -> bool:
-    """Check if a member join might be part of a raid"""
+async def check_raid_protection(member: discord.Member, check_join_rate: bool = True) -> bool:
+    """Check if a member join might be part of a raid
+
+    Joins whose cohort was already scored skip the join-rate rule and are
+    not counted towards it. The account-age rule always applies: a brand-new
+    account is suspicious on its own, whatever the cohort it arrived with.
+    """
     guild_id = member.guild.id
     now = datetime.now()
     
-    # Add this join to the list
-    member_joins[guild_id].append(now)
-    
-    # Remove joins older than 1 minute
-    member_joins[guild_id] = [
-        join_time for join_time in member_joins[guild_id]
-        if now - join_time < timedelta(minutes=1)
-    ]
-    
-    # Check if too many joins in the last minute
-    if len(member_joins[guild_id]) > MAX_JOINS_PER_MINUTE:
-        return True
+    # Only unscored joins count towards the rate, so a busy moment that was
+    # already scored as benign can't push later joins over the limit
+    if check_join_rate:
+        # Add this join to the list
+        member_joins[guild_id].append(now)
+        
+        # Remove joins older than 1 minute
+        member_joins[guild_id] = [
+            join_time for join_time in member_joins[guild_id]
+            if now - join_time < timedelta(minutes=1)
+        ]
+        
+        # Check if too many joins in the last minute
+        if len(member_joins[guild_id]) > MAX_JOINS_PER_MINUTE:
+            return True
     
-    # Check account age
-    account_age = now - member.created_at
+    # Check account age (created_at is timezone-aware)
+    account_age = discord.utils.utcnow() - member.created_at
     if account_age < timedelta(hours=ACCOUNT_AGE_THRESHOLD_HOURS):
         suspicious_accounts[guild_id].add(member.id)
         return True
@@ -85,7 +96,7 @@ async def handle_raid_detection(bot: discord.Client, member: discord.Member):
             if channel.permissions_for(member.guild.me).send_messages:
                 embed = discord.Embed(
                     title="⚠️ Raid Protection Alert",
-                    description=f"Detected suspicious account: {member.mention}\nAccount age: {(datetime.now() - member.created_at).days} days",
+                    description=f"Detected suspicious account: {member.mention}\nAccount age: {(discord.utils.utcnow() - member.created_at).days} days",
                     color=discord.Color.red()
                 )
                 await channel.send(embed=embed)
@@ -93,33 +104,69 @@ async def handle_raid_detection(bot: discord.Client, member: discord.Member):
     except Exception as e:
         print(f"❌ Error handling raid detection: {e}")
 
-async def handle_spam_detection(message: discord.Message):
-    """Handle detected spam"""
+async def handle_cohort_raid(bot: discord.Client, members: list[discord.Member], score: float, features: dict):
+    """Handle a join cohort that was scored as a raid"""
+    guild = members[0].guild
+    print(f"⚠️ RAID COHORT DETECTED: {len(members)} joins in {guild.name} (score {score:.2f})")
+
+    kicked = 0
+    for member in members:
+        try:
+            await member.kick(reason=f"Anti-raid protection: Raid cohort (score {score:.2f})")
+            kicked += 1
+        except discord.Forbidden:
+            print(f"❌ No permission to kick {member.name}")
+        except discord.HTTPException as e:
+            print(f"❌ Could not kick {member.name}: {e}")
+
+    # Notify admins once for the whole cohort
     try:
-        # Delete spam messages
-        await message.delete()
-        
-        # Warn the user
-        warning = await message.channel.send(
-            f"{message.author.mention} ⚠️ Please slow down! Spam detected.",
-            delete_after=5
-        )
-        
-        # If spam continues, consider timeout
-        user_id = message.author.id
-        spam_count = len(message_spam[user_id])
-        
-        if spam_count > MAX_MESSAGES_PER_SECOND * 3:
-            # Apply timeout (mute) for 10 minutes
-            try:
-                timeout_until = datetime.now() + timedelta(minutes=10)
-                await message.author.timeout(timeout_until, reason="Spam detection")
-                await message.channel.send(
-                    f"{message.author.mention} has been timed out for 10 minutes due to spam.",
-                    delete_after=10
+        for channel in guild.text_channels:
+            if channel.permissions_for(guild.me).send_messages:
+                embed = discord.Embed(
+                    title="⚠️ Raid Protection Alert",
+                    description=f"Detected a raid wave of {len(members)} accounts, kicked {kicked}.",
+                    color=discord.Color.red()
                 )
-            except discord.Forbidden:
-                print(f"❌ No permission to timeout {message.author.name}")
+                embed.add_field(name="Score", value=f"{score:.2f}", inline=True)
+                for name, value in features.items():
+                    embed.add_field(name=name.replace('_', ' ').title(), value=f"{value:.2f}", inline=True)
+                await channel.send(embed=embed)
+                break
+    except Exception as e:
+        print(f"❌ Error handling raid cohort: {e}")
+
+def queue_spam_delete(message: discord.Message) -> tuple:
+    """Add a spam message to its author's pending deletes and return the job key"""
+    key = (message.channel.id, message.author.id)
+    pending = pending_spam_deletes.setdefault(key, {"channel": message.channel, "message_ids": []})
+    pending["message_ids"].append(message.id)
+    return ("spam_delete",) + key
+
+def discard_spam_delete(message: discord.Message):
+    """Forget a pending delete whose job was dropped"""
+    key = (message.channel.id, message.author.id)
+    pending = pending_spam_deletes.get(key)
+    if pending and message.id in pending["message_ids"]:
+        pending["message_ids"].remove(message.id)
+        if not pending["message_ids"]:
+            del pending_spam_deletes[key]
+
+async def handle_spam_detection(channel_id: int, author_id: int):
+    """Delete every pending spam message from one author in one channel"""
+    pending = pending_spam_deletes.pop((channel_id, author_id), None)
+    if not pending:
+        # An earlier job for this author already deleted them
+        return
+
+    channel = pending["channel"]
+    message_ids = pending["message_ids"]
+    try:
+        # Bulk delete takes at most 100 messages per call
+        for start in range(0, len(message_ids), 100):
+            await channel.delete_messages([discord.Object(id=message_id) for message_id in message_ids[start:start + 100]])
+    except discord.NotFound:
+        pass
     except Exception as e:
         print(f"❌ Error handling spam detection: {e}")
 
@@ -144,4 +191,6 @@ def clear_old_data():
         ]
         if not message_spam[user_id]:
             del message_spam[user_id]
-
+    
+    # Clear expired offense history
+    clear_old_offenses()
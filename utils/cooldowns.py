@@ -0,0 +1,50 @@
+from discord.ext import commands
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import (
+        EXPENSIVE_COMMAND_USER_RATE,
+        EXPENSIVE_COMMAND_USER_PER_SECONDS,
+        EXPENSIVE_COMMAND_GUILD_RATE,
+        EXPENSIVE_COMMAND_GUILD_PER_SECONDS
+    )
+except ImportError:
+    # Default values if config not available
+    EXPENSIVE_COMMAND_USER_RATE = 1
+    EXPENSIVE_COMMAND_USER_PER_SECONDS = 10
+    EXPENSIVE_COMMAND_GUILD_RATE = 3
+    EXPENSIVE_COMMAND_GUILD_PER_SECONDS = 30
+
+# Shared by every expensive command, so alternating between them doesn't
+# raise the allowed rate
+EXPENSIVE_COMMAND_MAPPINGS = (
+    (commands.CooldownMapping.from_cooldown(
+        EXPENSIVE_COMMAND_USER_RATE, EXPENSIVE_COMMAND_USER_PER_SECONDS, commands.BucketType.user
+    ), commands.BucketType.user),
+    (commands.CooldownMapping.from_cooldown(
+        EXPENSIVE_COMMAND_GUILD_RATE, EXPENSIVE_COMMAND_GUILD_PER_SECONDS, commands.BucketType.guild
+    ), commands.BucketType.guild),
+)
+
+async def _enforce_expensive_cooldown(*args):
+    # Called as (cog, ctx) for cog commands and (ctx) otherwise
+    ctx = args[-1]
+    buckets = [(mapping.get_bucket(ctx.message), bucket_type) for mapping, bucket_type in EXPENSIVE_COMMAND_MAPPINGS]
+
+    # Check every bucket before spending a token from any of them
+    for bucket, bucket_type in buckets:
+        if bucket is not None and bucket.get_tokens() == 0:
+            raise commands.CommandOnCooldown(bucket, bucket.get_retry_after(), bucket_type)
+    for bucket, _ in buckets:
+        if bucket is not None:
+            bucket.update_rate_limit()
+
+def expensive_command():
+    """Rate limit a command per user and per guild, across all expensive commands.
+
+    discord.py only allows one cooldown per command, so both buckets are
+    enforced in a before-invoke hook. A hook rather than a check keeps
+    ``!help`` (which runs checks) from spending cooldown tokens. Raises
+    ``commands.CommandOnCooldown`` like the built-in cooldowns.
+    """
+    return commands.before_invoke(_enforce_expensive_cooldown)
@@ -0,0 +1,172 @@
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from functools import partial
+import discord
+from utils.event_dispatcher import dispatcher
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import (
+        OFFENSE_HISTORY_MINUTES,
+        OFFENSE_BURST_SECONDS,
+        FIRST_TIMEOUT_MINUTES,
+        SECOND_TIMEOUT_MINUTES
+    )
+except ImportError:
+    # Default values if config not available
+    OFFENSE_HISTORY_MINUTES = 60
+    OFFENSE_BURST_SECONDS = 5
+    FIRST_TIMEOUT_MINUTES = 10
+    SECOND_TIMEOUT_MINUTES = 60
+
+# Penalty for the 1st, 2nd, 3rd and 4th+ offense in the history window
+PENALTY_TIERS = [
+    ("warn", None),
+    ("timeout", timedelta(minutes=FIRST_TIMEOUT_MINUTES)),
+    ("timeout", timedelta(minutes=SECOND_TIMEOUT_MINUTES)),
+    ("kick", None),
+]
+
+# Offense timestamps per (guild_id, user_id), at most one per tier is needed
+offense_history = defaultdict(lambda: deque(maxlen=len(PENALTY_TIERS)))
+# Highest tier enforced or in flight per (guild_id, user_id): (tier, claimed_at, held_for)
+applied_tiers = {}
+# Penalties waiting to be enforced per guild: {user_id: {"tier", "member", "channel"}}
+pending_penalties = defaultdict(dict)
+# Guilds with a penalty flush queued on the dispatcher
+scheduled_flushes = set()
+
+def _prune(history: deque, now: float):
+    while history and now - history[0] >= OFFENSE_HISTORY_MINUTES * 60:
+        history.popleft()
+
+def _hold_for(tier: int) -> float:
+    """How long a claimed tier keeps covering later offenses.
+
+    Ordinary tiers hold for the whole history window. The final tier only
+    holds for one burst: the offense history stays at that tier, so a kicked
+    spammer who rejoins and spams again is kicked again.
+    """
+    if tier == len(PENALTY_TIERS) - 1:
+        return OFFENSE_BURST_SECONDS
+    return OFFENSE_HISTORY_MINUTES * 60
+
+def _is_covered(key, tier: int, now: float) -> bool:
+    """Whether a tier at or above this one was enforced, or is in flight, and still holds"""
+    applied = applied_tiers.get(key)
+    return bool(applied) and now - applied[1] < applied[2] and applied[0] >= tier
+
+def record_offense(message: discord.Message):
+    """Record a spam offense and queue the penalty for its tier.
+
+    Detections within OFFENSE_BURST_SECONDS of the last offense belong to
+    the same burst and don't escalate. Penalties are collected per guild and
+    enforced in one batched flush, so each user costs at most one REST call
+    per tier no matter how many messages the burst contained.
+    """
+    if message.guild is None:
+        return
+
+    guild_id = message.guild.id
+    user_id = message.author.id
+    key = (guild_id, user_id)
+    now = time.monotonic()
+
+    history = offense_history[key]
+    _prune(history, now)
+    if not history or now - history[-1] >= OFFENSE_BURST_SECONDS:
+        history.append(now)
+    tier = len(history) - 1
+
+    # Don't repeat a penalty that was already enforced in this window
+    if _is_covered(key, tier, now):
+        return
+
+    pending = pending_penalties[guild_id].get(user_id)
+    if pending:
+        # Fold the new offense into the queued penalty
+        pending["tier"] = max(pending["tier"], tier)
+    else:
+        pending_penalties[guild_id][user_id] = {"tier": tier, "member": message.author, "channel": message.channel}
+
+    # A flush the dispatcher shed is retried on the next offense
+    if guild_id not in scheduled_flushes:
+        if dispatcher.submit(guild_id, partial(flush_penalties, guild_id), critical=True):
+            scheduled_flushes.add(guild_id)
+
+async def flush_penalties(guild_id: int):
+    """Enforce every pending penalty for a guild, one action per user.
+
+    Each tier is claimed in ``applied_tiers`` before its REST call, so
+    offenses recorded while the flush runs don't queue the same tier again,
+    and a later flush skips any tier that is already covered.
+    """
+    scheduled_flushes.discard(guild_id)
+    penalties = pending_penalties.pop(guild_id, {})
+    now = time.monotonic()
+
+    claimed = []
+    for user_id, penalty in penalties.items():
+        key = (guild_id, user_id)
+        if _is_covered(key, penalty["tier"], now):
+            continue
+        claimed.append((user_id, penalty, applied_tiers.get(key)))
+        applied_tiers[key] = (penalty["tier"], now, _hold_for(penalty["tier"]))
+
+    for user_id, penalty, previous in claimed:
+        if not await enforce_penalty(guild_id, user_id, penalty):
+            # Release the claim so the next offense can retry this tier
+            key = (guild_id, user_id)
+            if previous is None:
+                applied_tiers.pop(key, None)
+            else:
+                applied_tiers[key] = previous
+
+async def enforce_penalty(guild_id: int, user_id: int, penalty: dict) -> bool:
+    """Apply a single penalty tier to a member. Returns False if it should be retried."""
+    action, duration = PENALTY_TIERS[penalty["tier"]]
+    member = penalty["member"]
+    channel = penalty["channel"]
+    try:
+        if action == "warn":
+            await channel.send(f"{member.mention} ⚠️ Please slow down! Spam detected.", delete_after=5)
+        elif action == "timeout":
+            await member.timeout(duration, reason="Spam detection: repeated offenses")
+            minutes = int(duration.total_seconds() // 60)
+            # The notice is cosmetic, so it can be dropped under load
+            dispatcher.submit(guild_id, partial(
+                channel.send,
+                f"{member.mention} has been timed out for {minutes} minutes due to spam.",
+                delete_after=10
+            ), cosmetic=True)
+        elif action == "kick":
+            await member.kick(reason="Spam detection: repeated offenses")
+            print(f"✅ Kicked {member.name} for repeated spam")
+    except discord.Forbidden:
+        # Retrying within the burst won't help without the permission, so only
+        # hold the claim for the burst; a later offense can try again
+        print(f"❌ No permission to {action} {member.name}")
+        applied_tiers[(guild_id, user_id)] = (penalty["tier"], time.monotonic(), OFFENSE_BURST_SECONDS)
+    except discord.HTTPException as e:
+        print(f"❌ Could not {action} {member.name}: {e}")
+        return False
+    return True
+
+def clear_old_offenses():
+    """Forget offense history and applied penalties that have aged out,
+    and retry penalty flushes the dispatcher dropped"""
+    now = time.monotonic()
+    for key in list(offense_history.keys()):
+        _prune(offense_history[key], now)
+        if not offense_history[key]:
+            del offense_history[key]
+    for key, (_, claimed_at, held_for) in list(applied_tiers.items()):
+        if now - claimed_at >= held_for:
+            del applied_tiers[key]
+    for guild_id in list(pending_penalties.keys()):
+        if not pending_penalties[guild_id]:
+            del pending_penalties[guild_id]
+        elif guild_id not in scheduled_flushes:
+            if dispatcher.submit(guild_id, partial(flush_penalties, guild_id), critical=True):
+                scheduled_flushes.add(guild_id)
@@ -0,0 +1,184 @@
+import asyncio
+import time
+from collections import defaultdict, deque
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import GUILD_QUEUE_MAX_SIZE, GUILD_QUEUE_OVERFLOW, EVENT_DISPATCH_WORKERS
+except ImportError:
+    # Default values if config not available
+    GUILD_QUEUE_MAX_SIZE = 100
+    GUILD_QUEUE_OVERFLOW = "drop_cosmetic"
+    EVENT_DISPATCH_WORKERS = 4
+
+OVERFLOW_POLICIES = ("coalesce", "drop_cosmetic", "shed")
+
+class Job:
+    """A unit of queued event work"""
+
+    __slots__ = ("factory", "cosmetic", "key", "enqueued_at")
+
+    def __init__(self, factory, cosmetic: bool, key):
+        self.factory = factory
+        self.cosmetic = cosmetic
+        self.key = key
+        self.enqueued_at = time.monotonic()
+
+class GuildQueue:
+    """A guild's pending jobs: moderation-critical jobs run before the rest"""
+
+    __slots__ = ("critical", "normal")
+
+    def __init__(self):
+        self.critical = deque()
+        self.normal = deque()
+
+    def __len__(self) -> int:
+        return len(self.critical) + len(self.normal)
+
+    def popleft(self) -> Job:
+        return self.critical.popleft() if self.critical else self.normal.popleft()
+
+    def oldest_enqueued_at(self) -> float:
+        return min(jobs[0].enqueued_at for jobs in (self.critical, self.normal) if jobs)
+
+class GuildEventDispatcher:
+    """Bounded per-guild job queues served round-robin by a fixed pool of workers.
+
+    Jobs from the same guild run one at a time, critical jobs first and
+    otherwise in submission order, while each worker takes the next guild
+    in turn, so a backlog in one guild only delays that guild.
+    """
+
+    def __init__(self, max_size: int = GUILD_QUEUE_MAX_SIZE, overflow: str = GUILD_QUEUE_OVERFLOW,
+                 workers: int = EVENT_DISPATCH_WORKERS):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {OVERFLOW_POLICIES}")
+        self.max_size = max_size
+        self.overflow = overflow
+        self.worker_count = workers
+        self.queues = defaultdict(GuildQueue)
+        # Guilds with pending jobs and no job in flight, in round-robin order
+        self.ready = asyncio.Queue()
+        self.active = set()
+        self.workers = []
+        self.processed = defaultdict(int)
+        self.dropped = defaultdict(int)
+        self.coalesced = defaultdict(int)
+        self.last_lag = {}
+
+    def start(self):
+        """Start the worker pool (call from within the running event loop)"""
+        if self.workers:
+            return
+        self.workers = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def submit(self, guild_id, factory, *, cosmetic: bool = False, critical: bool = False, key=None) -> bool:
+        """Queue a job for a guild.
+
+        ``factory`` is a zero-argument callable returning the coroutine to run,
+        so dropped jobs never create an un-awaited coroutine. ``critical`` jobs
+        (kicks, penalties) run ahead of the guild's other jobs and are never
+        dropped: on a full queue they evict a cosmetic job, then the oldest
+        other job, and only exceed the bound if the queue holds nothing but
+        critical jobs. ``cosmetic`` jobs (welcomes, notices) may be dropped
+        under load. Under the "coalesce" policy a job whose ``key`` matches a
+        job still waiting in the queue is merged into it instead of queued
+        again, so keyed jobs must pick up their work when they run rather
+        than when they are submitted. Returns False if the job was dropped.
+        """
+        queue = self.queues[guild_id]
+        job = Job(factory, cosmetic, key)
+
+        if critical:
+            if len(queue) >= self.max_size and queue.normal:
+                self._evict(guild_id, queue.normal)
+            queue.critical.append(job)
+        else:
+            if self.overflow == "coalesce" and self._coalesce(queue.normal, job):
+                self.coalesced[guild_id] += 1
+                return True
+            if len(queue) >= self.max_size:
+                if not (self.overflow == "drop_cosmetic" and self._evict_cosmetic(guild_id, queue.normal)):
+                    # Shed the new job rather than growing the backlog
+                    self.dropped[guild_id] += 1
+                    return False
+            queue.normal.append(job)
+
+        if guild_id not in self.active:
+            self.active.add(guild_id)
+            self.ready.put_nowait(guild_id)
+        return True
+
+    def _coalesce(self, jobs: deque, job: Job) -> bool:
+        """Replace a queued job with the same key, keeping its place in line"""
+        if job.key is None:
+            return False
+        for index, queued in enumerate(jobs):
+            if queued.key == job.key:
+                job.enqueued_at = queued.enqueued_at
+                jobs[index] = job
+                return True
+        return False
+
+    def _evict_cosmetic(self, guild_id, jobs: deque) -> bool:
+        """Drop the oldest cosmetic job to make room"""
+        for queued in jobs:
+            if queued.cosmetic:
+                jobs.remove(queued)
+                self.dropped[guild_id] += 1
+                return True
+        return False
+
+    def _evict(self, guild_id, jobs: deque):
+        """Drop the oldest cosmetic job, or failing that the oldest job"""
+        if not self._evict_cosmetic(guild_id, jobs):
+            jobs.popleft()
+            self.dropped[guild_id] += 1
+
+    async def _worker(self):
+        while True:
+            guild_id = await self.ready.get()
+            queue = self.queues[guild_id]
+            job = queue.popleft()
+            self.last_lag[guild_id] = time.monotonic() - job.enqueued_at
+            try:
+                await job.factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Error processing event for guild {guild_id}: {e}")
+            finally:
+                self.processed[guild_id] += 1
+                if queue:
+                    # Back of the line, so every other ready guild gets a turn first
+                    self.ready.put_nowait(guild_id)
+                else:
+                    self.active.discard(guild_id)
+                    del self.queues[guild_id]
+
+    def stats(self, guild_id=None) -> dict:
+        """Queue depth and lag for one guild, or for every guild with a queue"""
+        now = time.monotonic()
+        guild_ids = [guild_id] if guild_id is not None else list(self.queues)
+        result = {}
+        for gid in guild_ids:
+            queue = self.queues.get(gid)
+            result[gid] = {
+                "depth": len(queue) if queue else 0,
+                "oldest_wait": now - queue.oldest_enqueued_at() if queue else 0.0,
+                "last_lag": self.last_lag.get(gid, 0.0),
+                "processed": self.processed.get(gid, 0),
+                "dropped": self.dropped.get(gid, 0),
+                "coalesced": self.coalesced.get(gid, 0),
+            }
+        return result
+
+# Shared dispatcher for moderation work, started in the bot's setup_hook
+dispatcher = GuildEventDispatcher()
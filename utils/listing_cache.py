@@ -0,0 +1,31 @@
+import time
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import LISTING_CACHE_TTL_SECONDS
+except ImportError:
+    # Default values if config not available
+    LISTING_CACHE_TTL_SECONDS = 60
+
+# Rendered listing pages: (guild_id, kind, scope) -> (expires_at, pages, total)
+listing_cache = {}
+
+def get_listing(guild_id: int, kind: str, scope=None):
+    """Return cached (pages, total) for a listing, or None if missing or expired"""
+    entry = listing_cache.get((guild_id, kind, scope))
+    if entry is None:
+        return None
+    expires_at, pages, total = entry
+    if time.monotonic() >= expires_at:
+        del listing_cache[(guild_id, kind, scope)]
+        return None
+    return pages, total
+
+def store_listing(guild_id: int, kind: str, pages: list[str], total: int, scope=None):
+    """Cache rendered listing pages for LISTING_CACHE_TTL_SECONDS"""
+    listing_cache[(guild_id, kind, scope)] = (time.monotonic() + LISTING_CACHE_TTL_SECONDS, pages, total)
+
+def invalidate_listing(guild_id: int, kind: str):
+    """Drop every cached listing of a kind for a guild, whatever its scope"""
+    for key in [key for key in listing_cache if key[0] == guild_id and key[1] == kind]:
+        del listing_cache[key]
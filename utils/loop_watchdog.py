@@ -0,0 +1,178 @@
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import (
+        LOOP_WATCHDOG_INTERVAL_SECONDS,
+        LOOP_WATCHDOG_THRESHOLD_SECONDS,
+        LOOP_WATCHDOG_REPORT_SIZE,
+        PROFILE_SAMPLE_INTERVAL_SECONDS
+    )
+except ImportError:
+    # Default values if config not available
+    LOOP_WATCHDOG_INTERVAL_SECONDS = 0.1
+    LOOP_WATCHDOG_THRESHOLD_SECONDS = 0.5
+    LOOP_WATCHDOG_REPORT_SIZE = 20
+    PROFILE_SAMPLE_INTERVAL_SECONDS = 0.005
+
+# Frames from these directories are the bot's own code
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _is_project_frame(frame) -> bool:
+    filename = os.path.abspath(frame.f_code.co_filename)
+    return filename.startswith(PROJECT_ROOT) and "site-packages" not in filename
+
+def attribute_stack(frame) -> dict:
+    """Work out which handler a stack belongs to.
+
+    Reports the outermost ``on_*`` event handler, the command and cog from
+    any ``ctx`` in scope, and the innermost frame of the bot's own code.
+    """
+    event = command = cog = stage = None
+    while frame is not None:
+        code = frame.f_code
+        if code.co_name.startswith("on_"):
+            # Walking inner to outer, so the last match is the outermost handler
+            event = code.co_name
+        if command is None:
+            ctx = frame.f_locals.get("ctx")
+            if getattr(ctx, "command", None) is not None:
+                command = ctx.command.qualified_name
+                cog = ctx.cog.qualified_name if ctx.cog else None
+        if stage is None and _is_project_frame(frame):
+            stage = f"{os.path.relpath(code.co_filename, PROJECT_ROOT)}:{code.co_name}"
+        frame = frame.f_back
+    return {"event": event, "command": command, "cog": cog, "stage": stage}
+
+def describe_handler(attribution: dict) -> str:
+    """Short human-readable form of an attribution"""
+    parts = []
+    if attribution["event"]:
+        parts.append(attribution["event"])
+    if attribution["command"]:
+        parts.append(f"!{attribution['command']}" + (f" ({attribution['cog']})" if attribution["cog"] else ""))
+    if attribution["stage"]:
+        parts.append(attribution["stage"])
+    return " > ".join(parts) or "unknown"
+
+def folded_stack(frame) -> str:
+    """A stack in the collapsed 'outer;...;inner' format used by flame graph tools"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+class LoopWatchdog:
+    """Watchdog thread that measures event-loop lag and records stalls.
+
+    The event loop bumps a heartbeat every ``interval`` seconds. When the
+    watchdog thread sees the heartbeat fall more than ``threshold`` seconds
+    behind, it captures the loop thread's stack and keeps a rolling report.
+    """
+
+    def __init__(self, interval: float = LOOP_WATCHDOG_INTERVAL_SECONDS,
+                 threshold: float = LOOP_WATCHDOG_THRESHOLD_SECONDS,
+                 report_size: int = LOOP_WATCHDOG_REPORT_SIZE):
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls = deque(maxlen=report_size)
+        self.max_lag = 0.0
+        self.loop = None
+        self.loop_thread_id = None
+        self.last_beat = 0.0
+        self.thread = None
+        self.stopped = threading.Event()
+        self.heartbeat_handle = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, loop):
+        """Start watching ``loop`` (call from the thread running the loop)"""
+        if self.running:
+            return
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+        self.stopped.clear()
+        self._beat()
+        self.thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.heartbeat_handle:
+            self.heartbeat_handle.cancel()
+            self.heartbeat_handle = None
+
+    def _beat(self):
+        self.last_beat = time.monotonic()
+        if not self.stopped.is_set():
+            self.heartbeat_handle = self.loop.call_later(self.interval, self._beat)
+
+    def _watch(self):
+        current = None  # Record of the stall in progress, if any
+        while not self.stopped.wait(self.interval):
+            lag = time.monotonic() - self.last_beat - self.interval
+            if lag < self.threshold:
+                current = None
+                continue
+
+            self.max_lag = max(self.max_lag, lag)
+            if current is not None:
+                # Same stall, just longer
+                current["lag"] = lag
+                continue
+
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            attribution = attribute_stack(frame)
+            current = {
+                "time": datetime.now(),
+                "lag": lag,
+                "handler": describe_handler(attribution),
+                "attribution": attribution,
+                "stack": traceback.format_stack(frame),
+            }
+            del frame
+            self.stalls.append(current)
+            print(f"⚠️ Event loop stalled for {lag:.2f}s in {current['handler']}")
+
+    def report(self) -> str:
+        """Rolling report of recent stalls, newest first"""
+        if not self.stalls:
+            return "No event-loop stalls recorded."
+        lines = [f"{len(self.stalls)} recent stall(s), worst lag {self.max_lag:.2f}s"]
+        for stall in reversed(self.stalls):
+            lines.append(f"\n[{stall['time']:%H:%M:%S}] {stall['lag']:.2f}s in {stall['handler']}")
+            lines.extend(line.rstrip() for line in stall["stack"][-5:])
+        return "\n".join(lines)
+
+def sample_profile(thread_id: int, duration: float, interval: float = PROFILE_SAMPLE_INTERVAL_SECONDS) -> str:
+    """Sample a thread's stack for ``duration`` seconds.
+
+    Blocks the calling thread, so run it off the event loop. Returns the
+    samples in collapsed-stack format ("stack count" per line), which
+    flamegraph.pl and speedscope turn into a flame graph.
+    """
+    samples = Counter()
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            samples[folded_stack(frame)] += 1
+            del frame
+        time.sleep(interval)
+    return "\n".join(f"{stack} {count}" for stack, count in samples.most_common())
+
+# Shared watchdog, started in the bot's setup_hook when LOOP_WATCHDOG_ENABLED is set
+watchdog = LoopWatchdog()
@@ -0,0 +1,72 @@
+import discord
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import LISTING_PAGE_TIMEOUT_SECONDS
+except ImportError:
+    # Default values if config not available
+    LISTING_PAGE_TIMEOUT_SECONDS = 120
+
+def paginate(lines: list[str], per_page: int) -> list[str]:
+    """Split listing lines into page descriptions"""
+    return ["\n".join(lines[i:i + per_page]) for i in range(0, len(lines), per_page)]
+
+class ListingPaginator(discord.ui.View):
+    """Previous/next buttons that page through already rendered listing pages"""
+
+    def __init__(self, author_id: int, title: str, pages: list[str], footer: str,
+                 color: discord.Color = discord.Color.blue()):
+        super().__init__(timeout=LISTING_PAGE_TIMEOUT_SECONDS)
+        self.author_id = author_id
+        self.title = title
+        self.pages = pages
+        self.footer = footer
+        self.color = color
+        self.page = 0
+        self.message = None
+        self.update_buttons()
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(title=self.title, description=self.pages[self.page], color=self.color)
+        embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages)} • {self.footer}")
+        return embed
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= len(self.pages) - 1
+
+    async def send(self, ctx):
+        """Send the first page, with buttons only if there is more than one page"""
+        if len(self.pages) > 1:
+            self.message = await ctx.send(embed=self.build_embed(), view=self)
+        else:
+            self.stop()
+            await ctx.send(embed=self.build_embed())
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Only the member who ran the command can turn the pages
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("❌ Only the command author can change pages.", ephemeral=True)
+            return False
+        return True
+
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page -= 1
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page += 1
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
@@ -0,0 +1,148 @@
+import asyncio
+import re
+import statistics
+import time
+from collections import Counter
+from functools import partial
+import discord
+from utils.anti_bot import handle_cohort_raid
+from utils.event_dispatcher import dispatcher
+
+# Import config values (with defaults if not available)
+try:
+    from config.config import (
+        RAID_COHORT_WINDOW_SECONDS,
+        RAID_COHORT_QUIET_SECONDS,
+        RAID_COHORT_MIN_SIZE,
+        RAID_COHORT_MAX_SIZE,
+        RAID_COHORT_SCORE_THRESHOLD
+    )
+except ImportError:
+    # Default values if config not available
+    RAID_COHORT_WINDOW_SECONDS = 5
+    RAID_COHORT_QUIET_SECONDS = 1
+    RAID_COHORT_MIN_SIZE = 4
+    RAID_COHORT_MAX_SIZE = 1000
+    RAID_COHORT_SCORE_THRESHOLD = 0.6
+
+# Weight of each cohort feature in the final score (sums to 1)
+FEATURE_WEIGHTS = {
+    "creation_clustering": 0.35,
+    "name_similarity": 0.25,
+    "default_avatars": 0.2,
+    "join_regularity": 0.2,
+}
+
+_NAME_SKELETON = re.compile(r"[\d\W_]+")
+
+# Open cohort per guild: {"members": [...], "join_times": [...], "futures": [...]}
+join_cohorts = {}
+
+def _name_skeleton(name: str) -> str:
+    """Reduce a username to its letters so 'raider_01' and 'Raider22' match"""
+    return _NAME_SKELETON.sub("", name.lower())
+
+def _largest_share(values) -> float:
+    """Fraction of values equal to the most common value"""
+    counts = Counter(values)
+    if not counts:
+        return 0.0
+    return counts.most_common(1)[0][1] / len(values)
+
+def score_cohort(members: list[discord.Member], join_times: list[float]) -> tuple[float, dict]:
+    """Score a cohort of joins as a whole.
+
+    Each feature is computed in a single pass over the cohort and lies in
+    [0, 1], where higher means more raid-like. Returns the weighted score
+    and the individual features.
+    """
+    creation_hours = [int(member.created_at.timestamp() // 3600) for member in members]
+    skeletons = [skeleton for skeleton in map(_name_skeleton, (m.name for m in members)) if skeleton]
+    default_avatars = sum(member.avatar is None for member in members)
+
+    # Bots joining on a script arrive at near-constant intervals, which shows
+    # up as a low coefficient of variation of the gaps between joins
+    ordered = sorted(join_times)
+    intervals = [later - earlier for earlier, later in zip(ordered, ordered[1:])]
+    join_regularity = 0.0
+    if len(intervals) >= 2:
+        mean_interval = statistics.fmean(intervals)
+        if mean_interval > 0:
+            variation = statistics.pstdev(intervals, mean_interval) / mean_interval
+            join_regularity = max(0.0, 1.0 - variation)
+        else:
+            join_regularity = 1.0
+
+    features = {
+        "creation_clustering": _largest_share(creation_hours),
+        "name_similarity": _largest_share(skeletons),
+        "default_avatars": default_avatars / len(members) if members else 0.0,
+        "join_regularity": join_regularity,
+    }
+    score = sum(FEATURE_WEIGHTS[name] * value for name, value in features.items())
+    return score, features
+
+async def submit_join(bot: discord.Client, member: discord.Member) -> bool | None:
+    """Add a member to its guild's open cohort and wait for the cohort verdict.
+
+    Returns True if the cohort was scored as a raid and acted on as a whole,
+    False if it was scored as benign, and None if the cohort was too small
+    to score. Every join waits for its cohort, so a member is never welcomed
+    and then kicked with a raid wave it started; a lone join in a quiet
+    guild waits only RAID_COHORT_QUIET_SECONDS.
+    """
+    guild_id = member.guild.id
+    now = time.monotonic()
+
+    cohort = join_cohorts.get(guild_id)
+    if cohort is None:
+        cohort = {"members": [], "join_times": [], "futures": [], "opened_at": now}
+        join_cohorts[guild_id] = cohort
+        cohort["task"] = asyncio.create_task(_close_when_quiet(bot, guild_id, cohort))
+
+    cohort["members"].append(member)
+    cohort["join_times"].append(now)
+
+    future = asyncio.get_running_loop().create_future()
+    cohort["futures"].append(future)
+
+    if len(cohort["members"]) >= RAID_COHORT_MAX_SIZE:
+        cohort["task"].cancel()
+        cohort["task"] = asyncio.create_task(_close_cohort(bot, guild_id, cohort))
+
+    return await future
+
+async def _close_when_quiet(bot: discord.Client, guild_id: int, cohort: dict):
+    """Close a cohort once joins go quiet or its collection window has elapsed"""
+    deadline = cohort["opened_at"] + RAID_COHORT_WINDOW_SECONDS
+    while True:
+        wake_at = min(deadline, cohort["join_times"][-1] + RAID_COHORT_QUIET_SECONDS)
+        remaining = wake_at - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(remaining)
+    await _close_cohort(bot, guild_id, cohort)
+
+async def _close_cohort(bot: discord.Client, guild_id: int, cohort: dict):
+    """Score a cohort, queue the raid response if needed, and resolve every waiting join"""
+    if join_cohorts.get(guild_id) is cohort:
+        del join_cohorts[guild_id]
+
+    members = cohort["members"]
+    verdict = None
+    try:
+        if len(members) >= RAID_COHORT_MIN_SIZE:
+            score, features = score_cohort(members, cohort["join_times"])
+            verdict = score >= RAID_COHORT_SCORE_THRESHOLD
+            if verdict and not dispatcher.submit(
+                guild_id, partial(handle_cohort_raid, bot, members, score, features), critical=True
+            ):
+                # Nobody will act on the cohort, so let each join be checked on its own
+                print(f"❌ Could not queue raid response for guild {guild_id}")
+                verdict = None
+    except Exception as e:
+        print(f"❌ Error scoring join cohort: {e}")
+    finally:
+        for future in cohort["futures"]:
+            if not future.done():
+                future.set_result(verdict)